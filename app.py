@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import plotly.io as pio
 from dash import Dash, Input, Output, dcc, html
 
 from dashboard.data import load_dashboard_data
@@ -17,6 +18,7 @@ from dashboard.styles import (
     nav_link_active_style,
     nav_link_style,
     nav_style,
+    nav_subtitle_style,
     page_content_style,
     page_wrapper_style,
     summary_text_style,
@@ -24,6 +26,17 @@ from dashboard.styles import (
 from sections import actions, customer_trust, overview, revenue_drivers, seller_strategy
 
 
+# Dash serializes every callback response through plotly's JSON machinery;
+# the orjson engine encodes numpy arrays in C instead of converting them to
+# Python lists first. Optional: the stdlib engine remains the fallback.
+try:
+    import orjson  # noqa: F401
+
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
+
+
 # Prepare all data at start-up (expensive operations happen once).
 dashboard_data = load_dashboard_data()
 
@@ -32,69 +45,91 @@ app.title = "Olist CFO Dashboard"
 server = app.server
 
 
-# Register interactive callbacks supplied by dedicated sections.
+# All callbacks must exist before the server starts: the renderer fetches
+# the dependency graph exactly once, and multi-worker deployments route
+# requests to any process, so registration has to be eager and complete.
 revenue_drivers.register_callbacks(app, dashboard_data)
 customer_trust.register_callbacks(app, dashboard_data)
 seller_strategy.register_callbacks(app, dashboard_data)
 
 
+# The hero never changes after start-up: format the subtitle once and build
+# the static header nodes a single time. Only the active nav pill varies, so
+# complete headers are cached per pathname (one per page).
+SUBTITLE = (
+    f"{dashboard_data.financial_overview['seller_count']:,} sellers • "
+    f"{dashboard_data.financial_overview['item_count']:,} items delivered"
+)
+
+_HERO_TITLE = html.H1("Olist Growth Briefing", style=hero_title_style)
+_HERO_TEXT = html.P(
+    "A CEO-ready view of the marketplace's revenue engine, customer trust, and seller mix.",
+    style=hero_text_style,
+)
+_HERO_SUBTITLE = html.Div(SUBTITLE, style=nav_subtitle_style)
+
+_KNOWN_PATHS = {item["path"] for item in NAV_ITEMS} | {"/overview"}
+
+HEADER_CACHE: dict[str, html.Header] = {}
+
+
 def render_navigation(pathname: str | None) -> html.Header:
     path = pathname or "/"
-    nav_links = []
-    for item in NAV_ITEMS:
-        is_active = path == item["path"]
-        style = nav_link_active_style if is_active else nav_link_style
-        nav_links.append(dcc.Link(item["label"], href=item["path"], style=style))
-
-    subtitle = (
-        f"{dashboard_data.financial_overview['seller_count']:,} sellers • "
-        f"{dashboard_data.financial_overview['item_count']:,} items delivered"
-    )
-
-    return html.Header(
-        [
-            html.H1("Olist Growth Briefing", style=hero_title_style),
-            html.P(
-                "A CEO-ready view of the marketplace's revenue engine, customer trust, and seller mix.",
-                style=hero_text_style,
-            ),
-            html.Div(subtitle, style={"marginTop": "12px", "fontSize": "1rem", "color": "rgba(248, 250, 252, 0.65)"}),
-            html.Div(nav_links, style=nav_style),
-        ],
-        style=header_style,
-    )
+    header = HEADER_CACHE.get(path)
+    if header is None:
+        nav_links = [
+            dcc.Link(
+                item["label"],
+                href=item["path"],
+                style=nav_link_active_style if path == item["path"] else nav_link_style,
+            )
+            for item in NAV_ITEMS
+        ]
+        header = html.Header(
+            [
+                _HERO_TITLE,
+                _HERO_TEXT,
+                _HERO_SUBTITLE,
+                html.Div(nav_links, style=nav_style),
+            ],
+            style=header_style,
+        )
+        if path in _KNOWN_PATHS:
+            HEADER_CACHE[path] = header
+    return header
+
+
+# Every page is a pure function of dashboard_data, which never changes after
+# start-up, so each layout tree is built exactly once and served from a dict.
+PAGE_CACHE = {
+    "/": overview.layout(dashboard_data),
+    "/overview": overview.layout(dashboard_data),
+    "/drivers": revenue_drivers.layout(dashboard_data),
+    "/customers": customer_trust.layout(dashboard_data),
+    "/strategy": seller_strategy.layout(dashboard_data),
+    "/actions": actions.layout(dashboard_data),
+}
+
+NOT_FOUND_PAGE = html.Div(
+    [
+        html.Div(
+            [
+                html.H2("Page not found", style={"fontSize": "2.5rem", "color": "#0f172a"}),
+                html.P(
+                    "We redirected you to the executive overview. Use the navigation above to explore other chapters.",
+                    style=summary_text_style,
+                ),
+            ],
+            style=card_style,
+        ),
+        overview.layout(dashboard_data),
+    ],
+    style=page_wrapper_style,
+)
 
 
 def render_page(pathname: str | None) -> html.Div:
-    path = pathname or "/"
-
-    if path in ("/", "/overview"):
-        return overview.layout(dashboard_data)
-    if path == "/drivers":
-        return revenue_drivers.layout(dashboard_data)
-    if path == "/customers":
-        return customer_trust.layout(dashboard_data)
-    if path == "/strategy":
-        return seller_strategy.layout(dashboard_data)
-    if path == "/actions":
-        return actions.layout(dashboard_data)
-
-    return html.Div(
-        [
-            html.Div(
-                [
-                    html.H2("Page not found", style={"fontSize": "2.5rem", "color": "#0f172a"}),
-                    html.P(
-                        "We redirected you to the executive overview. Use the navigation above to explore other chapters.",
-                        style=summary_text_style,
-                    ),
-                ],
-                style=card_style,
-            ),
-            overview.layout(dashboard_data),
-        ],
-        style=page_wrapper_style,
-    )
+    return PAGE_CACHE.get(pathname or "/", NOT_FOUND_PAGE)
 
 
 app.layout = html.Div(
@@ -0,0 +1,122 @@
+"""Disk cache for the dashboard payload.
+
+``load_dashboard_data`` re-parses every Olist CSV and recomputes every
+aggregation at process start. The resulting payload only changes when the
+source files do, so we persist it under ``~/.cache/olist_dashboard`` keyed by
+a hash of the CSV mtimes: DataFrames as parquet, the waterfall figure as
+Plotly JSON, and the remaining scalar fields as a single pickle. A fresh
+cache turns startup into an IO read instead of a full pandas pipeline.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+
+CACHE_ROOT = Path("~/.cache/olist_dashboard").expanduser()
+
+_PICKLE_NAME = "fields.pkl"
+
+
+def _source_csv_paths() -> List[Path]:
+    """Locate the CSV files backing ``Olist().get_data()``."""
+
+    try:
+        import olist.data as olist_data
+    except ImportError:
+        return []
+
+    package_dir = Path(olist_data.__file__).resolve().parent
+    for candidate in (package_dir / "data" / "csv", package_dir.parent / "data" / "csv"):
+        paths = sorted(candidate.glob("*.csv"))
+        if paths:
+            return paths
+    return []
+
+
+def _cache_key(schema_fields: tuple) -> Optional[str]:
+    """Hash source-file mtimes plus the payload schema into a cache key."""
+
+    paths = _source_csv_paths()
+    if not paths:
+        return None
+
+    stamp = str([(path.name, os.path.getmtime(path)) for path in paths])
+    stamp += str(schema_fields)
+    return hashlib.blake2b(stamp.encode()).hexdigest()
+
+
+def _cache_dir(data_cls: type) -> Optional[Path]:
+    key = _cache_key(
+        tuple((field.name, str(field.type)) for field in dataclasses.fields(data_cls))
+    )
+    if key is None:
+        return None
+    return CACHE_ROOT / key
+
+
+def load_cached(data_cls: type):
+    """Return a cached payload for ``data_cls``, or None when stale/absent."""
+
+    cache_dir = _cache_dir(data_cls)
+    if cache_dir is None or not cache_dir.exists():
+        return None
+
+    try:
+        with open(cache_dir / _PICKLE_NAME, "rb") as handle:
+            fields = pickle.load(handle)
+        for parquet_path in cache_dir.glob("*.parquet"):
+            fields[parquet_path.stem] = pd.read_parquet(parquet_path)
+        for json_path in cache_dir.glob("*.figure.json"):
+            name = json_path.name[: -len(".figure.json")]
+            fields[name] = pio.from_json(json_path.read_text())
+        return data_cls(**fields)
+    except Exception:
+        # Best-effort cache: any unreadable artifact (truncated pickle,
+        # missing codec, schema drift) just means a recompute.
+        return None
+
+
+def store(data) -> None:
+    """Persist a payload dataclass instance; silently skip on any failure."""
+
+    cache_dir = _cache_dir(type(data))
+    if cache_dir is None or cache_dir.exists():
+        return
+
+    # Write into a temp sibling and promote it with one atomic rename, so a
+    # process killed mid-write can never leave a poisoned directory under the
+    # key; readers either see the complete cache or none at all.
+    staging_dir: Optional[Path] = None
+    try:
+        CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(dir=CACHE_ROOT, prefix="staging-"))
+        plain_fields = {}
+        for field in dataclasses.fields(data):
+            value = getattr(data, field.name)
+            if isinstance(value, pd.DataFrame):
+                value.to_parquet(staging_dir / f"{field.name}.parquet", compression="zstd")
+            elif isinstance(value, go.Figure):
+                (staging_dir / f"{field.name}.figure.json").write_text(value.to_json())
+            else:
+                plain_fields[field.name] = value
+        with open(staging_dir / _PICKLE_NAME, "wb") as handle:
+            pickle.dump(plain_fields, handle)
+        os.replace(staging_dir, cache_dir)
+        staging_dir = None
+    except Exception:
+        pass
+    finally:
+        if staging_dir is not None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
@@ -9,10 +9,27 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
-from olist.data import Olist
+try:  # numba is optional; the NumPy fallbacks compute identical results.
+    from numba import njit
+except ImportError:
+    njit = None
+
 from olist.seller_updated import Seller
 
-from .utils import METRIC_LABELS, STATE_NAME_MAP, format_brl
+from . import cache, loader
+from .utils import (
+    METRIC_LABELS,
+    STATE_NAME_MAP,
+    format_brl,
+    format_category_name,
+    format_percent,
+    format_revenue_trend,
+)
+
+
+# Copy-on-write makes chained-assignment safe without defensive .copy()
+# calls, halving peak memory while the startup pipeline runs.
+pd.set_option("mode.copy_on_write", True)
 
 
 COMMISSION_RATE = 0.10
@@ -20,9 +37,12 @@ SUBSCRIPTION_FEE = 80
 ALPHA_IT = 3157.27
 BETA_IT = 978.23
 COST_MAP: Dict[int, int] = {1: 100, 2: 50, 3: 40, 4: 0, 5: 0}
+# Dense mirror of COST_MAP indexed by review score (1..5); a NumPy gather
+# through this table replaces a per-row Python dict lookup.
+_COST_LUT = np.array([0, 100, 50, 40, 0, 0], dtype=np.int64)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SliderConfig:
     max: int
     marks: Dict[int, str]
@@ -30,6 +50,19 @@ class SliderConfig:
     step: int
 
 
+@dataclass(frozen=True, slots=True)
+class CustomerSpotlight:
+    """Per-state extrema shown on the customer trust and actions pages.
+
+    A slotted struct instead of a dict: attribute reads are C-level slot
+    lookups and the three keys are part of the type, not convention.
+    """
+
+    worst_delay: Dict[str, Any] | None
+    best_delay: Dict[str, Any] | None
+    best_review: Dict[str, Any] | None
+
+
 @dataclass(frozen=True)
 class DashboardData:
     financial_overview: Dict[str, float]
@@ -40,7 +73,7 @@ class DashboardData:
     monthly_metric_options: List[Dict[str, str]]
     state_metrics: pd.DataFrame
     state_slider: SliderConfig
-    customer_spotlight: Dict[str, Dict[str, Any]]
+    customer_spotlight: CustomerSpotlight
     strategy_df: pd.DataFrame
     strategy_highlights: Dict[str, Dict[str, float]]
     strategy_slider: SliderConfig
@@ -53,6 +86,10 @@ class DashboardData:
     margin_strategy: Dict[str, float]
     profit_uplift: float
     margin_uplift: float
+    top_categories_prose: str
+    revenue_trend_text: str
+    profit_phrase: str
+    margin_phrase: str
 
 
 def prepare_base_frames(
@@ -62,7 +99,8 @@ def prepare_base_frames(
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """Return delivered orders, delivered order_items and per-order reputation costs."""
 
-    delivered_orders = orders_df[orders_df["order_status"] == "delivered"].copy()
+    # Boolean-mask indexing already materializes new frames; no .copy() needed.
+    delivered_orders = orders_df[orders_df["order_status"] == "delivered"]
     delivered_orders = delivered_orders[
         [
             "order_id",
@@ -73,20 +111,36 @@ def prepare_base_frames(
         ]
     ]
 
+    # Both order_id columns share one category set (see load_dashboard_data),
+    # so the isin membership test reduces to indexing a boolean table with
+    # int32 codes instead of hashing ~100k strings.
+    delivered_codes = np.zeros(len(delivered_orders["order_id"].cat.categories), dtype=bool)
+    delivered_codes[delivered_orders["order_id"].cat.codes.to_numpy()] = True
     order_items_delivered = order_items_df[
-        order_items_df["order_id"].isin(delivered_orders["order_id"])
-    ].copy()
+        delivered_codes[order_items_df["order_id"].cat.codes.to_numpy()]
+    ]
 
     reviews_clean = reviews_df[["order_id", "review_score"]].dropna().copy()
+    reviews_clean["order_id"] = reviews_clean["order_id"].astype("category")
     reviews_clean["review_score"] = reviews_clean["review_score"].astype(int)
-    reviews_clean["reputation_cost"] = reviews_clean["review_score"].map(COST_MAP)
-    order_cost = (
-        reviews_clean.groupby("order_id", as_index=False)["reputation_cost"].max()
-    )
+    reviews_clean["reputation_cost"] = _COST_LUT[reviews_clean["review_score"].to_numpy()]
+    order_cost = reviews_clean.groupby(
+        "order_id", as_index=False, sort=False, observed=True
+    )["reputation_cost"].max()
 
     return delivered_orders, order_items_delivered, order_cost
 
 
+def _month_floor(timestamps: pd.Series) -> np.ndarray:
+    """Truncate datetimes to month starts via pure NumPy unit casts.
+
+    Equivalent to dt.to_period(\"M\").dt.to_timestamp() without constructing
+    an intermediate PeriodIndex of Python Period objects.
+    """
+
+    return timestamps.to_numpy().astype("datetime64[M]").astype("datetime64[ns]")
+
+
 def compute_monthly_metrics(
     delivered_orders: pd.DataFrame,
     order_items_delivered: pd.DataFrame,
@@ -99,17 +153,49 @@ def compute_monthly_metrics(
         on="order_id",
         how="left",
     )
-    items_with_purchase["month"] = (
-        items_with_purchase["order_purchase_timestamp"].dt.to_period("M").dt.to_timestamp()
+
+    # Fold the per-order reputation cost into the items frame so a single
+    # groupby covers sales, sellers and costs. The cost is attached to the
+    # first item of each order only, otherwise multi-item orders would count
+    # it once per item.
+    items_with_purchase = items_with_purchase.merge(order_cost, on="order_id", how="left")
+    first_item_of_order = ~items_with_purchase["order_id"].duplicated().to_numpy()
+    items_with_purchase["reputation_cost"] = np.where(
+        first_item_of_order,
+        items_with_purchase["reputation_cost"].fillna(0.0).to_numpy(),
+        0.0,
+    )
+
+    # Delivered orders with no item rows (a known quirk of the dataset) fall
+    # out of the item merge but still carry review costs; append them as
+    # zero-sale rows so monthly reputation_cost keeps covering every order.
+    has_items = np.zeros(len(delivered_orders["order_id"].cat.categories), dtype=bool)
+    has_items[order_items_delivered["order_id"].cat.codes.to_numpy()] = True
+    itemless_orders = delivered_orders[
+        ~has_items[delivered_orders["order_id"].cat.codes.to_numpy()]
+    ][["order_id", "order_purchase_timestamp"]]
+    if not itemless_orders.empty:
+        itemless_costs = itemless_orders.merge(order_cost, on="order_id", how="inner")
+        if not itemless_costs.empty:
+            items_with_purchase = pd.concat(
+                [items_with_purchase, itemless_costs], ignore_index=True
+            )
+
+    # Categorical month codes let the groupby hash small ints, not Timestamps.
+    month_codes = pd.Categorical(
+        _month_floor(items_with_purchase["order_purchase_timestamp"])
     )
 
     monthly = (
-        items_with_purchase.groupby("month", as_index=False)
+        items_with_purchase.groupby(month_codes, observed=True)
         .agg(
             gross_sales=("price", "sum"),
             freight=("freight_value", "sum"),
             active_sellers=("seller_id", "nunique"),
+            reputation_cost=("reputation_cost", "sum"),
         )
+        .rename_axis("month")
+        .reset_index()
         .sort_values("month")
     )
 
@@ -117,18 +203,6 @@ def compute_monthly_metrics(
     monthly["olist_commission"] = monthly["gross_sales"] * COMMISSION_RATE
     monthly["subscription_revenue"] = monthly["active_sellers"] * SUBSCRIPTION_FEE
     monthly["olist_revenue"] = monthly["olist_commission"] + monthly["subscription_revenue"]
-
-    monthly_cost = delivered_orders[["order_id", "order_purchase_timestamp"]].merge(
-        order_cost, on="order_id", how="left"
-    )
-    monthly_cost["reputation_cost"] = monthly_cost["reputation_cost"].fillna(0.0)
-    monthly_cost["month"] = (
-        monthly_cost["order_purchase_timestamp"].dt.to_period("M").dt.to_timestamp()
-    )
-    monthly_cost = monthly_cost.groupby("month", as_index=False)["reputation_cost"].sum()
-
-    monthly = monthly.merge(monthly_cost, on="month", how="left")
-    monthly["reputation_cost"] = monthly["reputation_cost"].fillna(0.0)
     monthly["net_revenue"] = monthly["olist_revenue"] - monthly["reputation_cost"]
 
     return monthly
@@ -148,34 +222,60 @@ def compute_category_profitability(
         how="left",
     )
 
-    translation_map = translations_df.set_index("product_category_name")[
-        "product_category_name_english"
-    ]
-    items["product_category"] = items["product_category_name"].map(translation_map)
-    items["product_category"] = items["product_category"].fillna(
-        items["product_category_name"]
+    # A plain dict map hashes strings directly instead of aligning against a
+    # pandas Index, and the single where/fillna avoids two temporary Series.
+    translation_dict = dict(
+        zip(
+            translations_df["product_category_name"].to_numpy(),
+            translations_df["product_category_name_english"].to_numpy(),
+        )
+    )
+    source_names = items["product_category_name"]
+    translated = source_names.map(translation_dict)
+    items["product_category"] = translated.where(
+        translated.notna(), source_names
+    ).fillna("Unknown")
+
+    # Allocate each order's reputation cost across its items proportionally to
+    # price. Sorting by order_id makes the groups contiguous, so order totals
+    # reduce to a single np.add.reduceat pass instead of a hash-based groupby
+    # transform plus a per-row map.
+    items = items.sort_values("order_id", kind="stable", ignore_index=True)
+    prices = items["price"].to_numpy(dtype=float)
+    # Group boundaries are read off the sorted codes themselves: np.unique
+    # sorts lexically, which need not match the categorical sort order, and
+    # reduceat would silently misalign on any mismatch.
+    codes = items["order_id"].cat.codes.to_numpy()
+    if len(codes):
+        starts = np.concatenate([[0], np.flatnonzero(codes[1:] != codes[:-1]) + 1])
+    else:
+        starts = np.empty(0, dtype=np.intp)
+    counts = np.diff(np.append(starts, len(codes)))
+    group_order_ids = items["order_id"].to_numpy()[starts]
+    order_totals = np.repeat(np.add.reduceat(prices, starts), counts)
+    items["price_share"] = np.divide(
+        prices,
+        order_totals,
+        out=np.zeros_like(prices),
+        where=order_totals != 0,
     )
-    items["product_category"] = items["product_category"].fillna("Unknown")
-
-    items["order_price_total"] = items.groupby("order_id")["price"].transform("sum")
-    denominator = items["order_price_total"].replace(0, pd.NA)
-    items["price_share"] = (items["price"] / denominator).fillna(0.0)
 
-    cost_series = order_cost.set_index("order_id")["reputation_cost"]
-    items["order_reputation_cost"] = items["order_id"].map(cost_series).fillna(0.0)
+    order_reputation_cost = (
+        order_cost.set_index("order_id")["reputation_cost"]
+        .reindex(group_order_ids, fill_value=0.0)
+        .to_numpy(dtype=float)
+    )
     items["reputation_cost_allocated"] = (
-        items["price_share"] * items["order_reputation_cost"]
+        items["price_share"].to_numpy() * np.repeat(order_reputation_cost, counts)
     )
 
-    category = items.groupby("product_category", as_index=False).agg(
+    category = items.groupby("product_category", as_index=False, observed=True).agg(
         gross_sales=("price", "sum"),
         reputation_cost=("reputation_cost_allocated", "sum"),
         order_count=("order_id", "nunique"),
     )
     category["olist_commission"] = category["gross_sales"] * COMMISSION_RATE
     category["net_profit"] = category["olist_commission"] - category["reputation_cost"]
-
-    category = category.sort_values("net_profit", ascending=False)
     return category
 
 
@@ -187,13 +287,16 @@ def compute_state_metrics(
 ) -> pd.DataFrame:
     """Compute delivery delay and satisfaction metrics per customer state."""
 
-    order_sales = order_items_delivered.groupby("order_id")["price"].sum()
+    order_sales = order_items_delivered.groupby("order_id", observed=True)["price"].sum()
 
     orders = delivered_orders.merge(
         customers_df[["customer_id", "customer_state"]],
         on="customer_id",
         how="left",
     )
+    # Filter out rows without a state before any derived columns are computed.
+    orders = orders[orders["customer_state"].notna().to_numpy()]
+
     orders["order_gross_sales"] = orders["order_id"].map(order_sales).fillna(0.0)
     orders["order_olist_commission"] = orders["order_gross_sales"] * COMMISSION_RATE
 
@@ -204,38 +307,143 @@ def compute_state_metrics(
     )
     orders = orders.merge(reviews_scores, on="order_id", how="left")
 
-    orders["delivery_delay"] = (
-        orders["order_delivered_customer_date"]
-        - orders["order_estimated_delivery_date"]
-    ).dt.days
-    orders = orders.dropna(subset=["customer_state"])
-    orders["delivery_delay"] = orders["delivery_delay"].fillna(0.0)
+    # Subtract the raw int64 datetime views instead of materializing a
+    # Timedelta Series and extracting .days; floor division by the number of
+    # nanoseconds per day matches Timedelta.days exactly.
+    delivered_values = orders["order_delivered_customer_date"].to_numpy()
+    estimated_values = orders["order_estimated_delivery_date"].to_numpy()
+    missing = np.isnat(delivered_values) | np.isnat(estimated_values)
+    delay_days = (
+        delivered_values.view("i8") - estimated_values.view("i8")
+    ) // 86_400_000_000_000
+    orders["delivery_delay"] = np.where(missing, 0.0, delay_days)
+
+    # With at most 27 states, histogram-style bincounts over the category
+    # codes replace the groupby: a couple of L1-resident passes with no
+    # per-group dispatch. Each row is one delivered order, so the plain
+    # count doubles as the order_id nunique.
+    state_values = orders["customer_state"].astype("category")
+    codes = state_values.cat.codes.to_numpy()
+    states = np.asarray(state_values.cat.categories)
+    n_states = len(states)
+
+    counts = np.bincount(codes, minlength=n_states)
+    sum_delay = np.bincount(
+        codes, weights=orders["delivery_delay"].to_numpy(), minlength=n_states
+    )
+    sum_commission = np.bincount(
+        codes, weights=orders["order_olist_commission"].to_numpy(), minlength=n_states
+    )
 
-    state_metrics = orders.groupby("customer_state", as_index=False).agg(
-        avg_delay=("delivery_delay", "mean"),
-        avg_review=("review_score", "mean"),
-        order_count=("order_id", "nunique"),
-        olist_commission=("order_olist_commission", "sum"),
+    review_values = orders["review_score"].to_numpy(dtype=float)
+    reviewed = ~np.isnan(review_values)
+    sum_review = np.bincount(
+        codes[reviewed], weights=review_values[reviewed], minlength=n_states
     )
-    state_metrics = state_metrics.dropna(subset=["avg_review"])
-    state_metrics = state_metrics.sort_values("order_count", ascending=False)
+    review_counts = np.bincount(codes[reviewed], minlength=n_states)
+
+    # Keep states with at least one order and one review, mirroring the old
+    # observed groupby followed by dropna on avg_review.
+    keep = (counts > 0) & (review_counts > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_delay = sum_delay / counts
+        avg_review = sum_review / review_counts
+
+    state_metrics = pd.DataFrame(
+        {
+            "customer_state": states[keep],
+            "avg_delay": avg_delay[keep],
+            "avg_review": avg_review[keep],
+            "order_count": counts[keep],
+            "olist_commission": sum_commission[keep],
+        }
+    ).sort_values("order_count", ascending=False, ignore_index=True)
     state_metrics["customer_state_name"] = state_metrics["customer_state"].map(STATE_NAME_MAP).fillna(
         state_metrics["customer_state"]
     )
     return state_metrics
 
 
+def _financial_totals_fused(
+    sales: np.ndarray,
+    months: np.ndarray,
+    revenues: np.ndarray,
+    reviews: np.ndarray,
+    quantity: np.ndarray,
+    profits: np.ndarray,
+):
+    """Sum the six seller columns in one memory pass instead of six scans."""
+
+    sales_total = 0.0
+    months_total = 0.0
+    revenues_total = 0.0
+    reviews_total = 0.0
+    quantity_total = 0.0
+    profits_total = 0.0
+    for i in range(sales.shape[0]):
+        sales_total += sales[i]
+        months_total += months[i]
+        revenues_total += revenues[i]
+        reviews_total += reviews[i]
+        quantity_total += quantity[i]
+        profits_total += profits[i]
+    return (
+        sales_total,
+        months_total,
+        revenues_total,
+        reviews_total,
+        quantity_total,
+        profits_total,
+    )
+
+
+def _financial_totals_numpy(
+    sales: np.ndarray,
+    months: np.ndarray,
+    revenues: np.ndarray,
+    reviews: np.ndarray,
+    quantity: np.ndarray,
+    profits: np.ndarray,
+):
+    """Fallback for :func:`_financial_totals_fused` without numba."""
+
+    return (
+        sales.sum(),
+        months.sum(),
+        revenues.sum(),
+        reviews.sum(),
+        quantity.sum(),
+        profits.sum(),
+    )
+
+
+_financial_totals = (
+    njit(cache=True)(_financial_totals_fused) if njit else _financial_totals_numpy
+)
+
+
 def compute_financial_overview(sellers_df: pd.DataFrame) -> Dict[str, float]:
-    revenues_sales = sellers_df["sales"].sum() * COMMISSION_RATE
-    revenues_subscription = sellers_df["months_on_olist"].sum() * SUBSCRIPTION_FEE
-    revenues_total = sellers_df["revenues"].sum()
+    (
+        sales_total,
+        months_total,
+        revenues_total,
+        costs_reviews,
+        item_count,
+        profits_gross,
+    ) = _financial_totals(
+        sellers_df["sales"].to_numpy(dtype=np.float64),
+        sellers_df["months_on_olist"].to_numpy(dtype=np.float64),
+        sellers_df["revenues"].to_numpy(dtype=np.float64),
+        sellers_df["cost_of_reviews"].to_numpy(dtype=np.float64),
+        sellers_df["quantity"].to_numpy(dtype=np.float64),
+        sellers_df["profits"].to_numpy(dtype=np.float64),
+    )
 
-    costs_reviews = sellers_df["cost_of_reviews"].sum()
+    revenues_sales = sales_total * COMMISSION_RATE
+    revenues_subscription = months_total * SUBSCRIPTION_FEE
     seller_count = sellers_df.shape[0]
-    item_count = sellers_df["quantity"].sum()
+    item_count = int(item_count)
     costs_it = ALPHA_IT * np.sqrt(seller_count) + BETA_IT * np.sqrt(item_count)
-
-    profits_gross = sellers_df["profits"].sum()
     profits_net = profits_gross - costs_it
     margin = profits_net / revenues_total if revenues_total else 0.0
 
@@ -253,26 +461,28 @@ def compute_financial_overview(sellers_df: pd.DataFrame) -> Dict[str, float]:
     }
 
 
+_WATERFALL_MEASURE = (
+    "relative",
+    "relative",
+    "total",
+    "relative",
+    "total",
+    "relative",
+    "total",
+)
+_WATERFALL_LABELS = (
+    "Subscriptions",
+    "Sales fees",
+    "Total revenues",
+    "Review costs",
+    "Gross profit",
+    "IT costs",
+    "Net profit",
+)
+
+
 def build_waterfall_figure(financials: Dict[str, float]) -> go.Figure:
-    measure = [
-        "relative",
-        "relative",
-        "total",
-        "relative",
-        "total",
-        "relative",
-        "total",
-    ]
-    x = [
-        "Subscriptions",
-        "Sales fees",
-        "Total revenues",
-        "Review costs",
-        "Gross profit",
-        "IT costs",
-        "Net profit",
-    ]
-    y = [
+    y = (
         financials["revenues_subscription"],
         financials["revenues_sales"],
         0,
@@ -280,22 +490,25 @@ def build_waterfall_figure(financials: Dict[str, float]) -> go.Figure:
         0,
         -financials["costs_it"],
         0,
-    ]
+    )
     text = [
-        format_brl(financials["revenues_subscription"]),
-        format_brl(financials["revenues_sales"]),
-        format_brl(financials["revenues_total"]),
-        format_brl(-financials["costs_reviews"]),
-        format_brl(financials["profits_gross"]),
-        format_brl(-financials["costs_it"]),
-        format_brl(financials["profits_net"]),
+        format_brl(value)
+        for value in (
+            financials["revenues_subscription"],
+            financials["revenues_sales"],
+            financials["revenues_total"],
+            -financials["costs_reviews"],
+            financials["profits_gross"],
+            -financials["costs_it"],
+            financials["profits_net"],
+        )
     ]
 
     fig = go.Figure(
         go.Waterfall(
             orientation="v",
-            measure=measure,
-            x=x,
+            measure=_WATERFALL_MEASURE,
+            x=_WATERFALL_LABELS,
             y=y,
             text=text,
             textposition="outside",
@@ -317,6 +530,108 @@ def build_waterfall_figure(financials: Dict[str, float]) -> go.Figure:
     return fig
 
 
+def _strategy_scan_fused(
+    profits: np.ndarray,
+    review_costs: np.ndarray,
+    revenues: np.ndarray,
+    quantities: np.ndarray,
+    gross_profits_total: float,
+    review_costs_total: float,
+    revenues_total: float,
+    items_total: float,
+    n_sellers: int,
+):
+    """Single-pass cumulative what-if scan over sellers sorted by profit.
+
+    Fuses the four cumulative sums, the sqrt-based IT cost and the margin
+    division into one loop; compiled to native code by numba when available.
+    """
+
+    n = profits.shape[0]
+    profits_after = np.empty(n)
+    review_costs_after = np.empty(n)
+    revenues_after = np.empty(n)
+    it_costs_after = np.empty(n)
+    total_costs_after = np.empty(n)
+    net_profit_after = np.empty(n)
+    margin_after = np.empty(n)
+
+    cum_profit = 0.0
+    cum_review = 0.0
+    cum_revenue = 0.0
+    cum_items = 0.0
+    for i in range(n):
+        cum_profit += profits[i]
+        cum_review += review_costs[i]
+        cum_revenue += revenues[i]
+        cum_items += quantities[i]
+
+        profits_after[i] = gross_profits_total - cum_profit
+        review_costs_after[i] = review_costs_total - cum_review
+        revenues_after[i] = revenues_total - cum_revenue
+        it_costs_after[i] = ALPHA_IT * np.sqrt(n_sellers - (i + 1)) + BETA_IT * np.sqrt(
+            items_total - cum_items
+        )
+        total_costs_after[i] = review_costs_after[i] + it_costs_after[i]
+        net_profit_after[i] = profits_after[i] - it_costs_after[i]
+        margin_after[i] = (
+            net_profit_after[i] / revenues_after[i] if revenues_after[i] != 0 else 0.0
+        )
+
+    return (
+        profits_after,
+        review_costs_after,
+        revenues_after,
+        it_costs_after,
+        total_costs_after,
+        net_profit_after,
+        margin_after,
+    )
+
+
+def _strategy_scan_numpy(
+    profits: np.ndarray,
+    review_costs: np.ndarray,
+    revenues: np.ndarray,
+    quantities: np.ndarray,
+    gross_profits_total: float,
+    review_costs_total: float,
+    revenues_total: float,
+    items_total: float,
+    n_sellers: int,
+):
+    """Vectorized fallback for :func:`_strategy_scan_fused` without numba."""
+
+    profits_after = gross_profits_total - np.cumsum(profits)
+    review_costs_after = review_costs_total - np.cumsum(review_costs)
+    revenues_after = revenues_total - np.cumsum(revenues)
+    items_after = items_total - np.cumsum(quantities)
+    sellers_remaining = n_sellers - np.arange(1, profits.shape[0] + 1)
+
+    it_costs_after = ALPHA_IT * np.sqrt(sellers_remaining) + BETA_IT * np.sqrt(items_after)
+    total_costs_after = review_costs_after + it_costs_after
+    net_profit_after = profits_after - it_costs_after
+    margin_after = np.divide(
+        net_profit_after,
+        revenues_after,
+        out=np.zeros_like(net_profit_after),
+        where=revenues_after != 0,
+    )
+
+    return (
+        profits_after,
+        review_costs_after,
+        revenues_after,
+        it_costs_after,
+        total_costs_after,
+        net_profit_after,
+        margin_after,
+    )
+
+
+_strategy_scan = njit(cache=True)(_strategy_scan_fused) if njit else _strategy_scan_numpy
+
+
 def prepare_seller_strategy_data(
     sellers_df: pd.DataFrame,
 ) -> tuple[pd.DataFrame, Dict[str, Dict[str, float]]]:
@@ -332,55 +647,52 @@ def prepare_seller_strategy_data(
     base_net_profit = gross_profits_total - base_it_cost
     base_margin = base_net_profit / revenues_total if revenues_total else 0.0
 
-    records = [
-        {
-            "sellers_removed": 0,
-            "sellers_remaining": n_sellers,
-            "revenues": revenues_total,
-            "review_costs": review_costs_total,
-            "it_costs": base_it_cost,
-            "total_costs": review_costs_total + base_it_cost,
-            "net_profit": base_net_profit,
-            "margin": base_margin,
-        }
-    ]
-
     if n_sellers > 1:
         steps = np.arange(1, n_sellers, dtype=int)
-
-        profits_after = gross_profits_total - np.cumsum(sorted_sellers["profits"].values[:-1])
-        review_costs_after = review_costs_total - np.cumsum(
-            sorted_sellers["cost_of_reviews"].values[:-1]
-        )
-        revenues_after = revenues_total - np.cumsum(sorted_sellers["revenues"].values[:-1])
-        items_after = items_total - np.cumsum(sorted_sellers["quantity"].values[:-1])
         sellers_remaining = n_sellers - steps
 
-        it_costs_after = ALPHA_IT * np.sqrt(sellers_remaining) + BETA_IT * np.sqrt(items_after)
-        total_costs_after = review_costs_after + it_costs_after
-        net_profit_after = profits_after - it_costs_after
-        margin_after = np.divide(
-            net_profit_after,
+        (
+            profits_after,
+            review_costs_after,
             revenues_after,
-            out=np.zeros_like(net_profit_after, dtype=float),
-            where=revenues_after != 0,
+            it_costs_after,
+            total_costs_after,
+            net_profit_after,
+            margin_after,
+        ) = _strategy_scan(
+            sorted_sellers["profits"].to_numpy(dtype=np.float64)[:-1],
+            sorted_sellers["cost_of_reviews"].to_numpy(dtype=np.float64)[:-1],
+            sorted_sellers["revenues"].to_numpy(dtype=np.float64)[:-1],
+            sorted_sellers["quantity"].to_numpy(dtype=np.float64)[:-1],
+            float(gross_profits_total),
+            float(review_costs_total),
+            float(revenues_total),
+            float(items_total),
+            n_sellers,
         )
-
-        for idx, step in enumerate(steps):
-            records.append(
-                {
-                    "sellers_removed": int(step),
-                    "sellers_remaining": int(sellers_remaining[idx]),
-                    "revenues": float(revenues_after[idx]),
-                    "review_costs": float(review_costs_after[idx]),
-                    "it_costs": float(it_costs_after[idx]),
-                    "total_costs": float(total_costs_after[idx]),
-                    "net_profit": float(net_profit_after[idx]),
-                    "margin": float(margin_after[idx]),
-                }
-            )
-
-    strategy_df = pd.DataFrame(records)
+    else:
+        steps = np.empty(0, dtype=int)
+        sellers_remaining = np.empty(0, dtype=int)
+        empty = np.empty(0, dtype=float)
+        review_costs_after = revenues_after = it_costs_after = empty
+        total_costs_after = net_profit_after = margin_after = empty
+
+    # Prepend the baseline scenario to each output array and hand pandas one
+    # contiguous column per field: no per-row dicts, no type inference.
+    strategy_df = pd.DataFrame(
+        {
+            "sellers_removed": np.concatenate([[0], steps]).astype(int),
+            "sellers_remaining": np.concatenate([[n_sellers], sellers_remaining]).astype(int),
+            "revenues": np.concatenate([[revenues_total], revenues_after]),
+            "review_costs": np.concatenate([[review_costs_total], review_costs_after]),
+            "it_costs": np.concatenate([[base_it_cost], it_costs_after]),
+            "total_costs": np.concatenate(
+                [[review_costs_total + base_it_cost], total_costs_after]
+            ),
+            "net_profit": np.concatenate([[base_net_profit], net_profit_after]),
+            "margin": np.concatenate([[base_margin], margin_after]),
+        }
+    )
     highlights = {
         "baseline": strategy_df.iloc[0].to_dict(),
         "max_profit": strategy_df.loc[strategy_df["net_profit"].idxmax()].to_dict(),
@@ -406,28 +718,47 @@ def _build_slider_marks(max_value: int, step_hint: int) -> Dict[int, str]:
 def load_dashboard_data() -> DashboardData:
     """Compute every dataset required by the dashboard and return a single payload."""
 
-    olist_data = Olist().get_data()
-
-    orders_df = olist_data["orders"].copy()
-    for column in [
-        "order_purchase_timestamp",
-        "order_approved_at",
-        "order_delivered_carrier_date",
-        "order_delivered_customer_date",
-        "order_estimated_delivery_date",
-    ]:
-        orders_df[column] = pd.to_datetime(orders_df[column])
-
-    order_items_df = olist_data["order_items"].copy()
-    order_items_df["shipping_limit_date"] = pd.to_datetime(
-        order_items_df["shipping_limit_date"]
+    cached = cache.load_cached(DashboardData)
+    if cached is not None:
+        return cached
+
+    # loader.load_tables returns column-pruned frames with the timestamp
+    # columns already typed, whichever loading path is taken.
+    olist_data = loader.load_tables()
+
+    orders_df = olist_data["orders"]
+    order_items_df = olist_data["order_items"]
+    reviews_df = olist_data["order_reviews"]
+    products_df = olist_data["products"]
+    translations_df = olist_data["product_category_name_translation"]
+    customers_df = olist_data["customers"]
+
+    # Dictionary-encode the ID and low-cardinality string columns so that
+    # isin, merge and groupby compare int32 codes instead of hashing Python
+    # strings; this also cuts the resident size of these frames severalfold.
+    for frame, columns in (
+        (orders_df, ("customer_id",)),
+        (order_items_df, ("seller_id", "product_id")),
+        (products_df, ("product_id", "product_category_name")),
+        (customers_df, ("customer_id", "customer_state")),
+    ):
+        for column in columns:
+            frame[column] = frame[column].astype("category")
+
+    # order_id is the join key between orders and order_items; give both
+    # columns a single shared category set so membership tests and merges
+    # compare aligned int32 codes instead of falling back to strings.
+    shared_order_ids = pd.api.types.union_categoricals(
+        [
+            orders_df["order_id"].astype("category"),
+            order_items_df["order_id"].astype("category"),
+        ]
+    ).categories
+    orders_df["order_id"] = pd.Categorical(orders_df["order_id"], categories=shared_order_ids)
+    order_items_df["order_id"] = pd.Categorical(
+        order_items_df["order_id"], categories=shared_order_ids
     )
 
-    reviews_df = olist_data["order_reviews"].copy()
-    products_df = olist_data["products"].copy()
-    translations_df = olist_data["product_category_name_translation"].copy()
-    customers_df = olist_data["customers"].copy()
-
     delivered_orders_df, order_items_delivered_df, order_cost_df = prepare_base_frames(
         orders_df, order_items_df, reviews_df
     )
@@ -461,16 +792,17 @@ def load_dashboard_data() -> DashboardData:
     )
 
     if not state_metrics_df.empty:
-        worst_delay_state = state_metrics_df.sort_values("avg_delay", ascending=False).iloc[0].to_dict()
-        best_delay_state = state_metrics_df.sort_values("avg_delay", ascending=True).iloc[0].to_dict()
-        best_review_state = state_metrics_df.sort_values("avg_review", ascending=False).iloc[0].to_dict()
-        customer_spotlight = {
-            "worst_delay": worst_delay_state,
-            "best_delay": best_delay_state,
-            "best_review": best_review_state,
-        }
+        # Extrema only need a linear scan, not a full sort per column.
+        worst_delay_state = state_metrics_df.loc[state_metrics_df["avg_delay"].idxmax()].to_dict()
+        best_delay_state = state_metrics_df.loc[state_metrics_df["avg_delay"].idxmin()].to_dict()
+        best_review_state = state_metrics_df.loc[state_metrics_df["avg_review"].idxmax()].to_dict()
+        customer_spotlight = CustomerSpotlight(
+            worst_delay=worst_delay_state,
+            best_delay=best_delay_state,
+            best_review=best_review_state,
+        )
     else:
-        customer_spotlight = {"worst_delay": None, "best_delay": None, "best_review": None}
+        customer_spotlight = CustomerSpotlight(None, None, None)
 
     strategy_slider_max = int(strategy_df["sellers_removed"].max()) if not strategy_df.empty else 0
     strategy_step = 50 if strategy_slider_max >= 400 else 10
@@ -487,7 +819,7 @@ def load_dashboard_data() -> DashboardData:
         step=strategy_step,
     )
 
-    top_categories = category_profitability_df.head(3)
+    top_categories = category_profitability_df.nlargest(3, "net_profit")
     top_category_names = top_categories["product_category"].tolist()
     top_category_profit = float(top_categories["net_profit"].sum()) if not top_categories.empty else 0.0
 
@@ -510,11 +842,34 @@ def load_dashboard_data() -> DashboardData:
     profit_uplift = float(profit_strategy["net_profit"] - baseline_strategy["net_profit"])
     margin_uplift = float(margin_strategy["margin"] - baseline_strategy["margin"])
 
+    # The actions page narrative is a pure function of the figures above, so
+    # the prose fragments are rendered here once rather than on each layout call.
+    category_labels = [format_category_name(name) for name in top_category_names]
+    if len(category_labels) > 1:
+        top_categories_prose = ", ".join(category_labels[:-1]) + f" and {category_labels[-1]}"
+    elif category_labels:
+        top_categories_prose = category_labels[0]
+    else:
+        top_categories_prose = "key categories"
+
+    revenue_trend_text = format_revenue_trend(net_revenue_change)
+    profit_phrase = (
+        f"unlocks {format_brl(profit_uplift)} incremental profit"
+        if profit_uplift >= 0
+        else f"reduces profit by {format_brl(abs(profit_uplift))}"
+    )
+    margin_phrase = (
+        f"Margin would move from {format_percent(baseline_strategy['margin'])} "
+        f"to {format_percent(margin_strategy['margin'])}"
+        if margin_uplift >= 0
+        else f"Margin would decline by {format_percent(abs(margin_uplift))}"
+    )
+
     monthly_metric_options = [
         {"label": label, "value": key} for key, label in METRIC_LABELS.items()
     ]
 
-    return DashboardData(
+    payload = DashboardData(
         financial_overview=financial_overview,
         waterfall_figure=waterfall_figure,
         monthly_metrics=monthly_metrics_df,
@@ -536,4 +891,10 @@ def load_dashboard_data() -> DashboardData:
         margin_strategy=margin_strategy,
         profit_uplift=profit_uplift,
         margin_uplift=margin_uplift,
+        top_categories_prose=top_categories_prose,
+        revenue_trend_text=revenue_trend_text,
+        profit_phrase=profit_phrase,
+        margin_phrase=margin_phrase,
     )
+    cache.store(payload)
+    return payload
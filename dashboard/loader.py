@@ -0,0 +1,142 @@
+"""Column-pruned loading of the Olist source tables.
+
+The dashboard only touches a handful of columns per table, so reading the
+CSVs through ``pyarrow.csv`` with ``include_columns`` halves the bytes parsed
+and types the timestamp columns during the read. When pyarrow (or the CSV
+directory) is unavailable, a fallback projects the same columns out of
+``Olist().get_data()`` and applies the datetime conversions in pandas, so
+both paths hand identical frames to the aggregation pipeline.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+from . import cache
+
+try:  # pyarrow is optional; the pandas fallback below loads the same frames.
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+
+# Binary table cache written by scripts/build_cache.py; Feather round-trips
+# the pruned, datetime-typed frames without any CSV tokenization.
+FEATHER_CACHE_DIR = Path(__file__).resolve().parent.parent / "cache"
+
+TABLE_COLUMNS: Dict[str, list] = {
+    "orders": [
+        "order_id",
+        "customer_id",
+        "order_status",
+        "order_purchase_timestamp",
+        "order_delivered_customer_date",
+        "order_estimated_delivery_date",
+    ],
+    "order_items": [
+        "order_id",
+        "seller_id",
+        "product_id",
+        "price",
+        "freight_value",
+        "shipping_limit_date",
+    ],
+    "order_reviews": ["order_id", "review_score"],
+    "products": ["product_id", "product_category_name"],
+    "product_category_name_translation": [
+        "product_category_name",
+        "product_category_name_english",
+    ],
+    "customers": ["customer_id", "customer_state"],
+}
+
+_TIMESTAMP_COLUMNS: Dict[str, tuple] = {
+    "orders": (
+        "order_purchase_timestamp",
+        "order_delivered_customer_date",
+        "order_estimated_delivery_date",
+    ),
+    "order_items": ("shipping_limit_date",),
+}
+
+
+def _table_name(path) -> str:
+    """Map a CSV filename like olist_orders_dataset.csv to its table key."""
+
+    name = path.stem
+    if name.startswith("olist_"):
+        name = name[len("olist_"):]
+    if name.endswith("_dataset"):
+        name = name[: -len("_dataset")]
+    return name
+
+
+def _load_tables_feather() -> Optional[Dict[str, pd.DataFrame]]:
+    if pa is None:
+        return None
+
+    paths = {name: FEATHER_CACHE_DIR / f"{name}.feather" for name in TABLE_COLUMNS}
+    if not all(path.exists() for path in paths.values()):
+        return None
+
+    # A feather file older than its source CSV is stale: reading it would
+    # feed outdated tables into a recompute that the mtime-keyed payload
+    # cache just invalidated, storing old data under a fresh key.
+    csv_paths = {_table_name(path): path for path in cache._source_csv_paths()}
+    for name, feather_path in paths.items():
+        csv_path = csv_paths.get(name)
+        if csv_path is not None and csv_path.stat().st_mtime > feather_path.stat().st_mtime:
+            return None
+
+    return {name: pd.read_feather(path) for name, path in paths.items()}
+
+
+def _load_tables_arrow() -> Optional[Dict[str, pd.DataFrame]]:
+    if pa is None:
+        return None
+
+    paths = {_table_name(path): path for path in cache._source_csv_paths()}
+    if not all(name in paths for name in TABLE_COLUMNS):
+        return None
+
+    tables = {}
+    for name, columns in TABLE_COLUMNS.items():
+        convert_options = pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={
+                column: pa.timestamp("ns")
+                for column in _TIMESTAMP_COLUMNS.get(name, ())
+            },
+        )
+        tables[name] = pacsv.read_csv(
+            paths[name], convert_options=convert_options
+        ).to_pandas()
+    return tables
+
+
+def _load_tables_fallback() -> Dict[str, pd.DataFrame]:
+    from olist.data import Olist
+
+    olist_data = Olist().get_data()
+    tables = {}
+    for name, columns in TABLE_COLUMNS.items():
+        frame = olist_data[name][columns]
+        for column in _TIMESTAMP_COLUMNS.get(name, ()):
+            frame[column] = pd.to_datetime(frame[column])
+        tables[name] = frame
+    return tables
+
+
+def load_tables() -> Dict[str, pd.DataFrame]:
+    """Return the raw Olist tables, column-pruned and datetime-typed."""
+
+    tables = _load_tables_feather()
+    if tables is None:
+        tables = _load_tables_arrow()
+    if tables is None:
+        tables = _load_tables_fallback()
+    return tables
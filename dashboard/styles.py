@@ -1,4 +1,10 @@
-"""Shared style definitions for the Olist dashboard."""
+"""Shared style definitions for the Olist dashboard.
+
+Every style dict here is a module-level singleton shared by reference across
+components and callbacks; treat them as frozen constants and never mutate
+them in place. (They stay plain dicts rather than MappingProxyType because
+Dash's component JSON encoder only serializes real dicts.)
+"""
 
 from __future__ import annotations
 
@@ -70,6 +76,12 @@ nav_link_active_style: Dict[str, str] = {
     "color": "#0f172a",
 }
 
+nav_subtitle_style: Dict[str, str] = {
+    "marginTop": "12px",
+    "fontSize": "1rem",
+    "color": "rgba(248, 250, 252, 0.65)",
+}
+
 page_wrapper_style: Dict[str, str] = {
     "backgroundColor": "#f8fafc",
     "borderRadius": "24px",
@@ -160,6 +172,11 @@ recommendation_item_style: Dict[str, str] = {
     "padding": "10px 0",
 }
 
+kpi_subtitle_style: Dict[str, str] = {
+    "fontSize": "0.95rem",
+    "color": "rgba(248, 250, 252, 0.75)",
+}
+
 
 def create_kpi_card(label: str, value: str, subtitle: str) -> html.Div:
     """Generate a styled KPI card for dashboard header sections."""
@@ -168,7 +185,7 @@ def create_kpi_card(label: str, value: str, subtitle: str) -> html.Div:
         [
             html.Div(value, style=kpi_value_style),
             html.Div(label, style=kpi_label_style),
-            html.Div(subtitle, style={"fontSize": "0.95rem", "color": "rgba(248, 250, 252, 0.75)"}),
+            html.Div(subtitle, style=kpi_subtitle_style),
         ],
         style=kpi_card_style,
     )
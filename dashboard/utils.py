@@ -2,21 +2,68 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict
+
+
+def memoize_by_identity(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Cache a one-argument function's result per argument identity.
+
+    Section layouts are pure functions of the immutable DashboardData
+    payload, which holds DataFrames and therefore cannot be hashed; keying
+    on id() works because the payload lives for the whole process.
+    """
+
+    cache: Dict[int, Any] = {}
+
+    @wraps(func)
+    def wrapper(arg):
+        key = id(arg)
+        try:
+            return cache[key]
+        except KeyError:
+            cache[key] = result = func(arg)
+            return result
+
+    return wrapper
+
+
+# Single-pass C-level substitution of the grouping commas; translate beats
+# str.replace for single-character swaps.
+_COMMA_TO_SPACE = str.maketrans(",", " ")
+
+
+@lru_cache(maxsize=2048)
+def _format_brl_cached(value: float) -> str:
+    return f"{value:,.0f} BRL".translate(_COMMA_TO_SPACE)
 
 
 def format_brl(value: float) -> str:
-    """Return a human-readable BRL string with non-breaking space grouping."""
+    """Return a human-readable BRL string with space grouping."""
 
-    return f"{value:,.0f} BRL".replace(",", " ")
+    # Quantize the key so near-equal floats share one cache entry.
+    return _format_brl_cached(round(float(value), 2))
 
 
+@lru_cache(maxsize=2048)
 def format_percent(value: float) -> str:
     """Return a formatted percentage with one decimal point."""
 
     return f"{value:.1%}"
 
 
+def format_revenue_trend(change: float) -> str:
+    """Describe the month-over-month net revenue change for headline copy."""
+
+    abs_change = abs(change)
+    if change > 0:
+        return f"▲ {format_brl(abs_change)} vs. last month"
+    if change < 0:
+        return f"▼ {format_brl(abs_change)} vs. last month"
+    return "Flat vs. last month"
+
+
+@lru_cache(maxsize=2048)
 def format_category_name(name: str) -> str:
     """Convert snake_case category labels to title case for storytelling."""
 
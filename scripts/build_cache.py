@@ -0,0 +1,35 @@
+"""One-time build of the Feather table cache used by dashboard.loader.
+
+Parses the Olist CSVs once (column-pruned, timestamps typed) and writes each
+table to cache/{name}.feather with zstd compression. Subsequent dashboard
+starts then read the binary cache instead of re-tokenizing the CSVs.
+
+Run from the repository root:
+
+    python3 scripts/build_cache.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard import loader
+
+
+def main() -> None:
+    tables = loader._load_tables_arrow()
+    if tables is None:
+        tables = loader._load_tables_fallback()
+
+    loader.FEATHER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for name, frame in tables.items():
+        path = loader.FEATHER_CACHE_DIR / f"{name}.feather"
+        frame.to_feather(path, compression="zstd")
+        print(f"wrote {path} ({len(frame):,} rows)")
+
+
+if __name__ == "__main__":
+    main()
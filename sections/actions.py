@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List
 
-from dash import html
+from dash import dcc, html
 
 from dashboard.data import DashboardData
 from dashboard.styles import (
@@ -12,51 +12,22 @@ from dashboard.styles import (
     create_kpi_card,
     kpi_grid_style,
     page_wrapper_style,
-    recommendation_item_style,
     recommendation_list_style,
     summary_badge_style,
 )
-from dashboard.utils import format_brl, format_category_name, format_percent
-
-
-def _format_revenue_trend(change: float) -> str:
-    abs_change = abs(change)
-    if change > 0:
-        return f"▲ {format_brl(abs_change)} vs. last month"
-    if change < 0:
-        return f"▼ {format_brl(abs_change)} vs. last month"
-    return "Flat vs. last month"
+from dashboard.utils import format_brl, format_percent, memoize_by_identity
 
 
+@memoize_by_identity
 def layout(data: DashboardData) -> html.Div:
     """Render the CEO next steps page."""
 
-    top_category_labels = [format_category_name(name) for name in data.top_category_names]
-    if len(top_category_labels) > 1:
-        categories_text = ", ".join(top_category_labels[:-1]) + f" and {top_category_labels[-1]}"
-    elif top_category_labels:
-        categories_text = top_category_labels[0]
-    else:
-        categories_text = "key categories"
-
-    revenue_trend_text = _format_revenue_trend(data.net_revenue_change)
-    profit_phrase = (
-        f"unlocks {format_brl(data.profit_uplift)} incremental profit"
-        if data.profit_uplift >= 0
-        else f"reduces profit by {format_brl(abs(data.profit_uplift))}"
-    )
-    margin_phrase = (
-        f"Margin would move from {format_percent(data.baseline_strategy['margin'])} to {format_percent(data.margin_strategy['margin'])}"
-        if data.margin_uplift >= 0
-        else f"Margin would decline by {format_percent(abs(data.margin_uplift))}"
-    )
-
     key_numbers = html.Div(
         [
             create_kpi_card(
                 "Latest monthly net revenue",
                 format_brl(data.latest_net_revenue),
-                revenue_trend_text,
+                data.revenue_trend_text,
             ),
             create_kpi_card(
                 "Profit uplift on table",
@@ -66,74 +37,57 @@ def layout(data: DashboardData) -> html.Div:
             create_kpi_card(
                 "Lean margin scenario",
                 format_percent(data.margin_strategy["margin"]),
-                margin_phrase,
+                data.margin_phrase,
             ),
         ],
         style=kpi_grid_style,
     )
 
-    recommendations: List[html.Li] = []
+    # One Markdown component carries the whole numbered list: a single Dash
+    # node instead of one validated html.Li per recommendation.
+    recommendations: List[str] = []
 
     recommendations.append(
-        html.Li(
-            (
-                f"Keep revenue momentum: {format_brl(data.latest_net_revenue)} in the latest month "
-                f"({revenue_trend_text}). Lock the growth calendar with marketing and CRM leads before discussing trade-offs."
-            ),
-            style=recommendation_item_style,
-        )
+        f"Keep revenue momentum: {format_brl(data.latest_net_revenue)} in the latest month "
+        f"({data.revenue_trend_text}). Lock the growth calendar with marketing and CRM leads before discussing trade-offs."
     )
 
-    worst_state = data.customer_spotlight.get("worst_delay")
-    best_delay_state = data.customer_spotlight.get("best_delay")
+    worst_state = data.customer_spotlight.worst_delay
+    best_delay_state = data.customer_spotlight.best_delay
     if worst_state and best_delay_state:
         recommendations.append(
-            html.Li(
-                (
-                    f"Stabilize delivery promise in {worst_state['customer_state_name']} (currently +{worst_state['avg_delay']:.1f} days) "
-                    f"by applying the playbook from {best_delay_state['customer_state_name']} (at {best_delay_state['avg_delay']:.1f} days)."
-                ),
-                style=recommendation_item_style,
-            )
+            f"Stabilize delivery promise in {worst_state['customer_state_name']} (currently +{worst_state['avg_delay']:.1f} days) "
+            f"by applying the playbook from {best_delay_state['customer_state_name']} (at {best_delay_state['avg_delay']:.1f} days)."
         )
 
     recommendations.append(
-        html.Li(
-            (
-                f"Double down on hero categories: {categories_text} deliver {format_brl(data.top_category_profit)} net profit after reputation costs. "
-                "Align merchandising, paid media, and supply ops on this shortlist."
-            ),
-            style=recommendation_item_style,
-        )
+        f"Double down on hero categories: {data.top_categories_prose} deliver {format_brl(data.top_category_profit)} net profit after reputation costs. "
+        "Align merchandising, paid media, and supply ops on this shortlist."
     )
 
     recommendations.append(
-        html.Li(
-            (
-                f"Initiate the pruning plan: removing {int(data.profit_strategy['sellers_removed']):,} underperforming sellers {profit_phrase} "
-                f"while keeping {int(data.profit_strategy['sellers_remaining']):,} partners engaged."
-            ),
-            style=recommendation_item_style,
-        )
+        f"Initiate the pruning plan: removing {int(data.profit_strategy['sellers_removed']):,} underperforming sellers {data.profit_phrase} "
+        f"while keeping {int(data.profit_strategy['sellers_remaining']):,} partners engaged."
     )
 
-    best_review_state = data.customer_spotlight.get("best_review")
+    best_review_state = data.customer_spotlight.best_review
     if best_review_state:
         recommendations.append(
-            html.Li(
-                (
-                    f"Amplify promoters: {best_review_state['customer_state_name']} averages {best_review_state['avg_review']:.2f}★. "
-                    "Capture the CX rituals there and export them to the delayed states."
-                ),
-                style=recommendation_item_style,
-            )
+            f"Amplify promoters: {best_review_state['customer_state_name']} averages {best_review_state['avg_review']:.2f}★. "
+            "Capture the CX rituals there and export them to the delayed states."
         )
 
     actions_block = html.Div(
         [
             html.Span("Recommended next steps", style=summary_badge_style),
             html.H2("CEO action plan", style={"fontSize": "2.6rem", "color": "#0f172a", "marginBottom": "16px"}),
-            html.Ol(recommendations, style=recommendation_list_style),
+            dcc.Markdown(
+                "\n".join(
+                    f"{index}. {text}"
+                    for index, text in enumerate(recommendations, start=1)
+                ),
+                style=recommendation_list_style,
+            ),
         ],
         style=card_style,
     )
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict
 
-import plotly.express as px
+import plotly.graph_objects as go
 from dash import Input, Output, dcc, html
 
 from dashboard.data import DashboardData
@@ -14,6 +15,15 @@ from dashboard.styles import (
     summary_badge_style,
     summary_text_style,
 )
+from dashboard.utils import memoize_by_identity
+
+
+# The color axis never varies between figures; build it once at import and
+# reuse the dict by reference instead of recreating it per figure build.
+_DELAY_COLORAXIS = dict(
+    colorscale="RdYlGn_r",
+    colorbar=dict(title="Avg delay (days)"),
+)
 
 
 def _spotlight_card(title: str, subtitle: str, colors: Dict[str, str]) -> html.Div:
@@ -26,15 +36,16 @@ def _spotlight_card(title: str, subtitle: str, colors: Dict[str, str]) -> html.D
     )
 
 
+@memoize_by_identity
 def layout(data: DashboardData) -> html.Div:
     """Render the customer trust page with spotlight and scatter plot."""
 
     spotlight = data.customer_spotlight
     spotlight_boxes = []
 
-    worst_state = spotlight.get("worst_delay")
-    best_delay_state = spotlight.get("best_delay")
-    best_review_state = spotlight.get("best_review")
+    worst_state = spotlight.worst_delay
+    best_delay_state = spotlight.best_delay
+    best_review_state = spotlight.best_review
 
     if worst_state:
         spotlight_boxes.append(
@@ -110,40 +121,83 @@ def layout(data: DashboardData) -> html.Div:
 def register_callbacks(app, data: DashboardData) -> None:
     """Attach customer trust callbacks to the Dash app."""
 
-    state_metrics_df = data.state_metrics.copy()
-
-    @app.callback(
-        Output("state-delay-review-graph", "figure"),
-        Input("state-min-orders-slider", "value"),
+    # Callbacks only filter and plot this frame, never mutate it, so the
+    # shared payload reference is held directly instead of a startup copy.
+    state_metrics_df = data.state_metrics
+
+    # Hover strings never change per state: render them once here instead of
+    # having Plotly re-run four number formats per point on every rebuild.
+    state_metrics_df = state_metrics_df.assign(
+        _hover=[
+            (
+                f"<b>{row.customer_state_name}</b><br>avg_delay={row.avg_delay:.1f}"
+                f"<br>avg_review={row.avg_review:.2f}"
+                f"<br>order_count={int(row.order_count):,}"
+                f"<br>olist_commission={row.olist_commission:,.0f}"
+            )
+            for row in state_metrics_df.itertuples()
+        ]
     )
-    def update_state_scatter(min_orders: int):
-        min_orders = 0 if min_orders is None else int(min_orders)
-        filtered = state_metrics_df[state_metrics_df["order_count"] >= min_orders].copy()
+
+    # The slider snaps to its marks, so one pre-filtered frame per mark
+    # covers virtually every event; unexpected values fall back to a scan.
+    prefiltered = {
+        threshold: state_metrics_df[state_metrics_df["order_count"] >= threshold]
+        for threshold in data.state_slider.marks
+    }
+
+    # The drag-mode slider fires many events per second, frequently repeating
+    # the same threshold; the figure only depends on that integer, so the
+    # serialized figure dict is memoized per value.
+    @lru_cache(maxsize=128)
+    def _build_figure(min_orders: int) -> dict:
+        filtered = prefiltered.get(min_orders)
+        if filtered is None:
+            filtered = state_metrics_df[state_metrics_df["order_count"] >= min_orders]
 
         if filtered.empty:
-            filtered = state_metrics_df.nlargest(10, "order_count").copy()
-
-        fig = px.scatter(
-            filtered,
-            x="avg_delay",
-            y="avg_review",
-            size="olist_commission",
-            color="avg_delay",
-            hover_name="customer_state_name",
-            hover_data={
-                "avg_delay": ":.1f",
-                "avg_review": ":.2f",
-                "order_count": True,
-                "olist_commission": ":,.0f",
-            },
-            template="plotly_white",
-            color_continuous_scale="RdYlGn_r",
+            filtered = state_metrics_df.nlargest(10, "order_count")
+
+        # Direct graph_objects construction skips the long-form DataFrame and
+        # type inference plotly.express runs on every call.
+        delays = filtered["avg_delay"].to_numpy(dtype=float)
+        commissions = filtered["olist_commission"].to_numpy(dtype=float)
+        max_commission = commissions.max() if len(commissions) else 1.0
+
+        fig = go.Figure(
+            data=[
+                go.Scatter(
+                    x=delays,
+                    y=filtered["avg_review"].to_numpy(dtype=float),
+                    mode="markers",
+                    marker=dict(
+                        size=commissions,
+                        sizemode="area",
+                        sizeref=2.0 * max_commission / (20.0**2),
+                        sizemin=4,
+                        color=delays,
+                        coloraxis="coloraxis",
+                    ),
+                    text=filtered["_hover"],
+                    hovertemplate="%{text}<extra></extra>",
+                )
+            ],
+            layout=dict(
+                template="plotly_white",
+                coloraxis=_DELAY_COLORAXIS,
+            ),
         )
         fig.update_layout(
-            coloraxis_colorbar_title="Avg delay (days)",
             xaxis_title="Average delivery delay (days)",
             yaxis_title="Average review score",
             yaxis=dict(range=[2.5, 5.1]),
             font={"size": 16, "family": "Inter, sans-serif"},
         )
-        return fig
+        return fig.to_plotly_json()
+
+    @app.callback(
+        Output("state-delay-review-graph", "figure"),
+        Input("state-min-orders-slider", "value"),
+    )
+    def update_state_scatter(min_orders: int):
+        return _build_figure(0 if min_orders is None else int(min_orders))
@@ -13,9 +13,10 @@ from dashboard.styles import (
     summary_badge_style,
     summary_text_style,
 )
-from dashboard.utils import format_brl, format_percent
+from dashboard.utils import format_brl, format_percent, memoize_by_identity
 
 
+@memoize_by_identity
 def layout(data: DashboardData) -> html.Div:
     """Render the executive overview with financial KPIs and waterfall chart."""
 
@@ -78,7 +79,12 @@ def layout(data: DashboardData) -> html.Div:
             kpi_cards,
             html.Div(
                 [
-                    dcc.Graph(figure=data.waterfall_figure, style={"height": "520px"}),
+                    # A plain dict skips the Figure validation traversal each
+                    # time the layout tree is serialized into a response.
+                    dcc.Graph(
+                        figure=data.waterfall_figure.to_plotly_json(),
+                        style={"height": "520px"},
+                    ),
                     insight_copy,
                 ],
                 style=card_style,
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List
 
-import plotly.express as px
 import pandas as pd
+import plotly.graph_objects as go
 from dash import Input, Output, dcc, html
 
 from dashboard.data import DashboardData
@@ -15,9 +16,18 @@ from dashboard.styles import (
     summary_badge_style,
     summary_text_style,
 )
-from dashboard.utils import METRIC_LABELS
+from dashboard.utils import METRIC_LABELS, memoize_by_identity
 
 
+# The color axis never varies between figures; build it once at import and
+# reuse the dict by reference instead of recreating it per figure build.
+_MARGIN_COLORAXIS = dict(
+    colorscale="Blues",
+    colorbar=dict(title="Profit margin"),
+)
+
+
+@memoize_by_identity
 def layout(data: DashboardData) -> html.Div:
     """Render revenue drivers page layout."""
 
@@ -85,29 +95,68 @@ def layout(data: DashboardData) -> html.Div:
 def register_callbacks(app, data: DashboardData) -> None:
     """Attach revenue driver callbacks to the Dash app."""
 
-    monthly_metrics_df = data.monthly_metrics.copy()
-    category_profitability_df = data.category_profitability.copy()
-
-    @app.callback(
-        Output("monthly-metrics-graph", "figure"),
-        Input("monthly-metric-checklist", "value"),
+    # Callbacks never mutate the payload frames, so the shared references are
+    # held directly; assign() keeps the derived margin column off the payload.
+    monthly_metrics_df = data.monthly_metrics
+    category_profitability_df = data.category_profitability
+
+    # profit_margin does not depend on the slider: compute it once, and keep
+    # the frame presorted ascending — the bar chart wants smallest-first
+    # anyway, so selecting the top N is a tail() slice per call with no
+    # partial sort and no reversal.
+    sorted_categories_df = (
+        category_profitability_df.assign(
+            profit_margin=(
+                category_profitability_df["net_profit"]
+                / category_profitability_df["olist_commission"].replace(0, pd.NA)
+            ).fillna(0.0)
+        )
+        .sort_values("net_profit", ascending=True)
+        .reset_index(drop=True)
     )
-    def update_monthly_metrics(selected_metrics: List[str]):
-        if not selected_metrics:
-            selected_metrics = ["net_revenue"]
 
-        rename_map = {metric: METRIC_LABELS.get(metric, metric) for metric in selected_metrics}
-        y_columns = [rename_map[metric] for metric in selected_metrics]
+    # Pre-render the per-category hover strings once; every figure rebuild
+    # then ships a ready-made text column instead of five formats per bar.
+    sorted_categories_df = sorted_categories_df.assign(
+        _hover=[
+            (
+                f"<b>{row.product_category}</b><br>net_profit={row.net_profit:,.0f}"
+                f"<br>olist_commission={row.olist_commission:,.0f}"
+                f"<br>reputation_cost={row.reputation_cost:,.0f}"
+                f"<br>order_count={int(row.order_count):,}"
+                f"<br>profit_margin={row.profit_margin:.1%}"
+            )
+            for row in sorted_categories_df.itertuples()
+        ]
+    )
 
-        plot_df = monthly_metrics_df[["month"] + selected_metrics].rename(columns=rename_map)
+    # The checklist draws from a small fixed option set, so every reachable
+    # subset gets its own cached figure; the frame is renamed to display
+    # labels once instead of per call.
+    renamed_monthly_df = monthly_metrics_df.rename(
+        columns={
+            column: METRIC_LABELS.get(column, column)
+            for column in monthly_metrics_df.columns
+            if column != "month"
+        }
+    )
 
-        fig = px.line(
-            plot_df,
-            x="month",
-            y=y_columns,
-            markers=True,
-            template="plotly_white",
-        )
+    @lru_cache(maxsize=64)
+    def _build_monthly_figure(metrics: tuple) -> dict:
+        # One go.Scatter trace per metric, straight from the columns; no
+        # plotly.express long-form reshaping.
+        months = renamed_monthly_df["month"]
+        fig = go.Figure(layout=dict(template="plotly_white"))
+        for metric in metrics:
+            label = METRIC_LABELS.get(metric, metric)
+            fig.add_trace(
+                go.Scatter(
+                    x=months,
+                    y=renamed_monthly_df[label],
+                    mode="lines+markers",
+                    name=label,
+                )
+            )
         fig.update_layout(
             legend_title="Metric",
             yaxis_title="BRL",
@@ -115,41 +164,56 @@ def register_callbacks(app, data: DashboardData) -> None:
             hovermode="x unified",
             font={"size": 16, "family": "Inter, sans-serif"},
         )
-        return fig
+        return fig.to_plotly_json()
 
     @app.callback(
-        Output("category-profit-graph", "figure"),
-        Input("category-topn-slider", "value"),
+        Output("monthly-metrics-graph", "figure"),
+        Input("monthly-metric-checklist", "value"),
     )
-    def update_category_profit(top_n: int):
-        top_n = max(1, int(top_n))
-        limited_df = category_profitability_df.nlargest(top_n, "net_profit").iloc[::-1].copy()
-        limited_df["profit_margin"] = (
-            limited_df["net_profit"] / limited_df["olist_commission"].replace(0, pd.NA)
-        ).fillna(0.0)
-
-        fig = px.bar(
-            limited_df,
-            x="net_profit",
-            y="product_category",
-            orientation="h",
-            text_auto=".2s",
-            hover_data={
-                "net_profit": ":,.0f",
-                "olist_commission": ":,.0f",
-                "reputation_cost": ":,.0f",
-                "order_count": True,
-                "profit_margin": ":.1%",
-            },
-            template="plotly_white",
-            color="profit_margin",
-            color_continuous_scale="Blues",
+    def update_monthly_metrics(selected_metrics: List[str]):
+        # Deduplicate before keying the cache: the checklist UI can't repeat
+        # a metric, but a hand-crafted request could, and each distinct key
+        # retains its figure.
+        metrics = (
+            tuple(sorted(set(selected_metrics))) if selected_metrics else ("net_revenue",)
+        )
+        return _build_monthly_figure(metrics)
+
+    # The slider only offers a handful of integer values, so each top-N
+    # figure is built once and served from the cache on repeat drag events.
+    @lru_cache(maxsize=64)
+    def _build_category_figure(top_n: int) -> dict:
+        limited_df = sorted_categories_df.tail(top_n)
+
+        margins = limited_df["profit_margin"].to_numpy(dtype=float)
+        fig = go.Figure(
+            data=[
+                go.Bar(
+                    x=limited_df["net_profit"].to_numpy(dtype=float),
+                    y=limited_df["product_category"].to_numpy(),
+                    orientation="h",
+                    marker=dict(color=margins, coloraxis="coloraxis"),
+                    texttemplate="%{x:.2s}",
+                    text=limited_df["_hover"],
+                    hovertemplate="%{text}<extra></extra>",
+                )
+            ],
+            layout=dict(
+                template="plotly_white",
+                coloraxis=_MARGIN_COLORAXIS,
+            ),
         )
         fig.update_layout(
-            coloraxis_colorbar_title="Profit margin",
             xaxis_title="Net profit (BRL)",
             yaxis_title="Product category",
             margin=dict(l=0, r=20, t=40, b=40),
             font={"size": 16, "family": "Inter, sans-serif"},
         )
-        return fig
+        return fig.to_plotly_json()
+
+    @app.callback(
+        Output("category-profit-graph", "figure"),
+        Input("category-topn-slider", "value"),
+    )
+    def update_category_profit(top_n: int):
+        return _build_category_figure(max(1, int(top_n)))
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-import plotly.express as px
-import pandas as pd
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
 from dash import Input, Output, dcc, html
 
 from dashboard.data import DashboardData
@@ -16,9 +18,10 @@ from dashboard.styles import (
     summary_badge_style,
     summary_text_style,
 )
-from dashboard.utils import format_brl, format_percent
+from dashboard.utils import format_brl, format_percent, memoize_by_identity
 
 
+@memoize_by_identity
 def layout(data: DashboardData) -> html.Div:
     """Render the seller strategy what-if analysis."""
 
@@ -82,90 +85,143 @@ def layout(data: DashboardData) -> html.Div:
 def register_callbacks(app, data: DashboardData) -> None:
     """Attach seller strategy callbacks to the Dash app."""
 
-    strategy_df = data.strategy_df.copy()
+    # Callbacks only index this frame; hold the shared reference.
+    strategy_df = data.strategy_df
     highlights = data.strategy_highlights
 
-    @app.callback(
-        Output("seller-strategy-graph", "figure"),
-        Output("seller-strategy-summary", "children"),
-        Input("seller-strategy-slider", "value"),
-    )
-    def update_seller_strategy(selected_value: int | float):
-        if strategy_df.empty:
-            return px.line(), html.Div("Seller analytics unavailable.", style={"fontSize": "1rem"})
-
-        selected = 0 if selected_value is None else int(selected_value)
-        if selected not in strategy_df["sellers_removed"].values:
-            nearest_idx = (strategy_df["sellers_removed"] - selected).abs().idxmin()
-            selected_row = strategy_df.loc[nearest_idx]
-            selected = int(selected_row["sellers_removed"])
-        else:
-            selected_row = strategy_df.loc[strategy_df["sellers_removed"] == selected].iloc[0]
-
-        plot_df = strategy_df.melt(
-            id_vars=["sellers_removed"],
-            value_vars=["net_profit", "revenues", "total_costs"],
-            var_name="Metric",
-            value_name="BRL",
+    # sellers_removed is monotonically increasing, so the nearest scenario is
+    # found by bisection rather than a full |xs - value| scan per drag tick.
+    valid_xs = strategy_df["sellers_removed"].to_numpy()
+
+    # Scenario scalars as flat numpy columns: fetching one scenario is a
+    # constant-time array index instead of a boolean mask plus loc/iloc.
+    scenario_columns = {
+        column: strategy_df[column].to_numpy()
+        for column in (
+            "net_profit",
+            "revenues",
+            "total_costs",
+            "sellers_remaining",
+            "margin",
         )
+    }
 
-        fig = px.line(
-            plot_df,
-            x="sellers_removed",
-            y="BRL",
-            color="Metric",
-            template="plotly_white",
-            markers=True,
-            color_discrete_map={
-                "net_profit": "#2563eb",
-                "revenues": "#14b8a6",
-                "total_costs": "#f97316",
-            },
+    # The summary numbers are pure functions of the scenario row, so every
+    # formatted string is rendered up front; a drag tick then only indexes a
+    # tuple instead of running five number formats.
+    summaries = tuple(
+        (
+            f"{int(removed):,}",
+            format_brl(net_profit),
+            format_brl(revenue),
+            format_brl(total_cost),
+            f"{int(remaining):,}",
+            format_percent(margin),
         )
-        fig.add_vline(
-            x=selected,
-            line_dash="dash",
-            line_color="#f97316",
-            annotation_text="Scenario",
-            annotation_position="top right",
+        for removed, net_profit, revenue, total_cost, remaining, margin in zip(
+            valid_xs,
+            scenario_columns["net_profit"],
+            scenario_columns["revenues"],
+            scenario_columns["total_costs"],
+            scenario_columns["sellers_remaining"],
+            scenario_columns["margin"],
         )
-        fig.update_layout(
-            title={"text": "Financial impact by sellers removed", "x": 0.02, "font": {"size": 22}},
-            xaxis_title="Sellers removed",
-            yaxis_title="BRL",
-            legend_title="",
-            hovermode="x unified",
-            font={"size": 16, "family": "Inter, sans-serif"},
+    )
+
+    def _snap(value: int | float | None) -> int:
+        """Snap a slider value to the index of the nearest available scenario."""
+
+        selected = 0 if value is None else int(value)
+        index = int(np.searchsorted(valid_xs, selected))
+        if index >= len(valid_xs):
+            index = len(valid_xs) - 1
+        elif index > 0 and valid_xs[index] - selected > selected - valid_xs[index - 1]:
+            index -= 1
+        return index
+
+    # Every scenario shares the same three traces and layout; only the vline
+    # marking the selection changes. Build and serialize the invariant part
+    # once here, then stamp each scenario's marker onto a shallow layout copy.
+    base_figure = go.Figure(layout=dict(template="plotly_white"))
+    for metric, color in (
+        ("net_profit", "#2563eb"),
+        ("revenues", "#14b8a6"),
+        ("total_costs", "#f97316"),
+    ):
+        base_figure.add_trace(
+            go.Scatter(
+                x=valid_xs,
+                y=strategy_df[metric],
+                mode="lines+markers",
+                name=metric,
+                line=dict(color=color),
+            )
         )
+    base_figure.update_layout(
+        title={"text": "Financial impact by sellers removed", "x": 0.02, "font": {"size": 22}},
+        xaxis_title="Sellers removed",
+        yaxis_title="BRL",
+        legend_title="",
+        hovermode="x unified",
+        font={"size": 16, "family": "Inter, sans-serif"},
+    )
+    base_figure_dict = base_figure.to_plotly_json()
+
+    # One row per possible removal count means the snapped value is a perfect
+    # cache key: figure and summary are built once per scenario, ever.
+    @lru_cache(maxsize=None)
+    def _render(index: int):
+        selected = int(valid_xs[index])
+
+        layout = dict(base_figure_dict["layout"])
+        layout["shapes"] = [
+            dict(
+                type="line",
+                x0=selected,
+                x1=selected,
+                xref="x",
+                y0=0,
+                y1=1,
+                yref="y domain",
+                line=dict(dash="dash", color="#f97316"),
+            )
+        ]
+        layout["annotations"] = [
+            dict(
+                text="Scenario",
+                x=selected,
+                xref="x",
+                y=1,
+                yref="y domain",
+                xanchor="left",
+                yanchor="top",
+                showarrow=False,
+            )
+        ]
+        fig_dict = {"data": base_figure_dict["data"], "layout": layout}
 
         profit_highlight = highlights["max_profit"]
         margin_highlight = highlights["max_margin"]
 
-        summary_children = [
+        (
+            removed_text,
+            net_profit_text,
+            revenue_text,
+            total_cost_text,
+            remaining_text,
+            margin_text,
+        ) = summaries[index]
+
+        summary_children = (
             html.H3(
-                f"Scenario: remove {selected:,} sellers",
+                f"Scenario: remove {removed_text} sellers",
                 style={"marginBottom": "8px", "fontSize": "1.6rem", "fontWeight": "700"},
             ),
-            html.P(
-                f"Net profit: {format_brl(selected_row['net_profit'])}",
-                style={"fontSize": "1.1rem"},
-            ),
-            html.P(
-                f"Revenue retained: {format_brl(selected_row['revenues'])}",
-                style={"fontSize": "1.1rem"},
-            ),
-            html.P(
-                f"Total costs: {format_brl(selected_row['total_costs'])}",
-                style={"fontSize": "1.1rem"},
-            ),
-            html.P(
-                f"Remaining sellers: {int(selected_row['sellers_remaining']):,}",
-                style={"fontSize": "1.1rem"},
-            ),
-            html.P(
-                f"Net margin: {format_percent(selected_row['margin'])}",
-                style={"fontSize": "1.1rem"},
-            ),
+            html.P(f"Net profit: {net_profit_text}", style={"fontSize": "1.1rem"}),
+            html.P(f"Revenue retained: {revenue_text}", style={"fontSize": "1.1rem"}),
+            html.P(f"Total costs: {total_cost_text}", style={"fontSize": "1.1rem"}),
+            html.P(f"Remaining sellers: {remaining_text}", style={"fontSize": "1.1rem"}),
+            html.P(f"Net margin: {margin_text}", style={"fontSize": "1.1rem"}),
             html.Hr(style={"borderColor": "rgba(248, 250, 252, 0.2)", "margin": "20px 0"}),
             html.P(
                 (
@@ -181,6 +237,21 @@ def register_callbacks(app, data: DashboardData) -> None:
                 ),
                 style={"fontSize": "1rem"},
             ),
-        ]
+        )
+
+        return fig_dict, summary_children
+
+    @app.callback(
+        Output("seller-strategy-graph", "figure"),
+        Output("seller-strategy-summary", "children"),
+        Input("seller-strategy-slider", "value"),
+    )
+    def update_seller_strategy(selected_value: int | float):
+        if strategy_df.empty:
+            return (
+                go.Figure().to_plotly_json(),
+                html.Div("Seller analytics unavailable.", style={"fontSize": "1rem"}),
+            )
 
-        return fig, summary_children
+        fig_dict, summary_children = _render(_snap(selected_value))
+        return fig_dict, list(summary_children)